@@ -4,7 +4,6 @@
 import argparse
 import asyncio
 import sys
-from pathlib import Path
 
 from droidrun.config_manager.config_manager import (
     DroidrunConfig,
@@ -40,6 +39,16 @@ Examples:
     return parser.parse_args()
 
 
+def get_loop_factory():
+    """Return uvloop's event loop factory if installed, else None (default loop)."""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional and unavailable on Windows
+        return None
+    return uvloop.new_event_loop
+
+
 async def main():
     """Main entry point for multi-device automation."""
     args = parse_args()
@@ -54,11 +63,8 @@ async def main():
         # Load configuration
         config_loader = ConfigLoader()
 
-        # Get API configuration
-        print("📝 Loading API configuration...")
-        api_config = config_loader.get_api_config()
-
-        # Get device configuration (with optional filter)
+        # Get device configuration first (with optional filter), so an empty
+        # fleet exits before any API/task config is resolved
         print("📱 Loading device configuration...")
         device_configs = config_loader.get_enabled_devices(args.device)
 
@@ -69,6 +75,10 @@ async def main():
 
         print(f"✅ Found {len(device_configs)} enabled device(s)")
 
+        # Get API configuration
+        print("📝 Loading API configuration...")
+        api_config = config_loader.get_api_config()
+
         # Get execution settings
         concurrency = config_loader.get_concurrency()
 
@@ -81,6 +91,7 @@ async def main():
         # Connect to devices
         print(f"\n{'='*60}")
         device_manager = DeviceManager()
+        await device_manager.start_server()
         connected_devices = await device_manager.connect_all(device_configs)
 
         if not connected_devices:
@@ -131,4 +142,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=get_loop_factory())
@@ -0,0 +1,27 @@
+"""Tests for BufferPool reuse."""
+
+from utils.buffer_pool import BufferPool
+
+
+def test_released_buffer_is_reused_from_offset_zero():
+    pool = BufferPool(1)
+
+    with pool.buffer() as buf:
+        buf.write(b"frame")
+        first = buf
+
+    with pool.buffer() as buf:
+        assert buf is first
+        assert buf.tell() == 0
+
+
+def test_oversized_buffer_is_replaced_on_release():
+    pool = BufferPool(1, max_size=4)
+
+    with pool.buffer() as buf:
+        buf.write(b"too large")
+        first = buf
+
+    with pool.buffer() as buf:
+        assert buf is not first
+        assert buf.getbuffer().nbytes == 0
@@ -0,0 +1,62 @@
+"""Tests for EmbeddingBatcher batching and error routing."""
+
+import asyncio
+
+import pytest
+
+from utils.embedding_batcher import EmbeddingBatcher
+
+
+def run_batcher(embed_batch, texts):
+    """Embed texts concurrently through one batcher, returning results and errors."""
+    async def run():
+        batcher = EmbeddingBatcher(embed_batch)
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    *(batcher.embed(text) for text in texts),
+                    return_exceptions=True,
+                ),
+                timeout=1,
+            )
+        finally:
+            await batcher.aclose()
+
+    return asyncio.run(run())
+
+
+def test_concurrent_texts_share_one_request():
+    calls = []
+
+    async def embed_batch(texts):
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    results = run_batcher(embed_batch, ["a", "bb", "ccc"])
+
+    assert results == [[1.0], [2.0], [3.0]]
+    assert calls == [["a", "bb", "ccc"]]
+
+
+def test_short_response_fails_only_unmatched_callers():
+    async def embed_batch(texts):
+        return [[1.0]]
+
+    first, second = run_batcher(embed_batch, ["a", "b"])
+
+    assert first == [1.0]
+    assert isinstance(second, ValueError)
+
+
+def test_rejected_input_fails_alone():
+    async def embed_batch(texts):
+        if "bad" in texts:
+            raise ValueError("input too long")
+        return [[float(len(text))] for text in texts]
+
+    good, bad, other = run_batcher(embed_batch, ["a", "bad", "ccc"])
+
+    assert good == [1.0]
+    assert other == [3.0]
+    with pytest.raises(ValueError, match="input too long"):
+        raise bad
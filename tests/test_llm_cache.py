@@ -0,0 +1,141 @@
+"""Tests for CachedLLM keys, writes and semantic scoping."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+pytest.importorskip("llama_index.core")
+pytest.importorskip("orjson")
+
+from llama_index.core.base.llms.types import (
+    ChatMessage,
+    ChatResponse,
+    CompletionResponse,
+    ImageBlock,
+    LLMMetadata,
+    TextBlock,
+)
+from llama_index.core.llms import CustomLLM
+
+from utils.llm_cache import CachedLLM
+from utils.semantic_cache import SemanticCache
+
+
+class CountingLLM(CustomLLM):
+    """Answer every chat call with a numbered response."""
+
+    temperature: float = 0.0
+    tool_calls: bool = False
+    calls: int = 0
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(model_name="counting")
+
+    def complete(self, prompt: str, formatted: bool = False, **kwargs: Any) -> CompletionResponse:
+        return CompletionResponse(text=prompt)
+
+    def stream_complete(self, prompt: str, formatted: bool = False, **kwargs: Any):
+        raise NotImplementedError
+
+    async def achat(self, messages, **kwargs: Any) -> ChatResponse:
+        self.calls += 1
+        additional_kwargs = {"tool_calls": [{"id": "call"}]} if self.tool_calls else {}
+        return ChatResponse(message=ChatMessage(
+            role="assistant",
+            content=f"answer {self.calls}",
+            additional_kwargs=additional_kwargs,
+        ))
+
+
+def user(text: str, **additional_kwargs: Any) -> ChatMessage:
+    return ChatMessage(role="user", content=text, additional_kwargs=additional_kwargs)
+
+
+def chat(llm, messages):
+    return asyncio.run(llm.achat(messages)).message.content
+
+
+def test_repeated_request_is_served_from_cache(tmp_path):
+    inner = CountingLLM()
+    llm = CachedLLM(inner, path=str(tmp_path))
+
+    assert chat(llm, [user("hi")]) == "answer 1"
+    assert chat(llm, [user("hi")]) == "answer 1"
+    assert inner.calls == 1
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+
+def test_sampling_llm_is_not_cached(tmp_path):
+    inner = CountingLLM(temperature=0.7)
+    llm = CachedLLM(inner, path=str(tmp_path))
+
+    chat(llm, [user("hi")])
+    chat(llm, [user("hi")])
+
+    assert inner.calls == 2
+
+
+def test_additional_kwargs_are_part_of_the_key(tmp_path):
+    inner = CountingLLM()
+    llm = CachedLLM(inner, path=str(tmp_path))
+
+    chat(llm, [user("hi", tool_call_id="a")])
+    chat(llm, [user("hi", tool_call_id="b")])
+
+    assert inner.calls == 2
+
+
+def test_tool_call_responses_are_not_stored(tmp_path):
+    inner = CountingLLM(tool_calls=True)
+    llm = CachedLLM(inner, path=str(tmp_path))
+
+    chat(llm, [user("hi")])
+    chat(llm, [user("hi")])
+
+    assert inner.calls == 2
+
+
+def test_concurrent_writes_of_one_key_leave_no_temp_files(tmp_path):
+    llm = CachedLLM(CountingLLM(), path=str(tmp_path))
+
+    async def run():
+        await asyncio.gather(*(
+            asyncio.to_thread(llm._write, "key", {"content": str(i)})
+            for i in range(20)
+        ))
+
+    asyncio.run(run())
+
+    assert [p.name for p in tmp_path.iterdir()] == ["key.json"]
+    assert llm._read("key") is not None
+
+
+def test_failed_write_does_not_fail_the_call(tmp_path):
+    # The cache directory can't be created under a regular file
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    llm = CachedLLM(CountingLLM(), path=str(blocker / "cache"))
+
+    assert chat(llm, [user("hi")]) == "answer 1"
+
+
+def test_semantic_hit_requires_the_same_screenshot(tmp_path):
+    async def embed(text):
+        return [1.0, 0.0]
+
+    def screen(pixels: bytes) -> ChatMessage:
+        return ChatMessage(role="user", blocks=[
+            TextBlock(text="what next?"),
+            ImageBlock(image=pixels, image_mimetype="image/jpeg"),
+        ])
+
+    inner = CountingLLM()
+    llm = CachedLLM(
+        inner, path=str(tmp_path), semantic_cache=SemanticCache(embed)
+    )
+
+    assert chat(llm, [screen(b"screen-a")]) == "answer 1"
+    assert chat(llm, [screen(b"screen-b")]) == "answer 2"
+    assert chat(llm, [screen(b"screen-a")]) == "answer 1"
@@ -0,0 +1,40 @@
+"""Tests for ConcurrencyLimitedLLM slot handling."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("llama_index.core")
+
+from llama_index.core.base.llms.types import ChatMessage
+from llama_index.core.llms import MockLLM
+
+from utils.llm_limiter import ConcurrencyLimitedLLM
+
+MESSAGES = [ChatMessage(role="user", content="hello")]
+
+
+def test_unconsumed_stream_does_not_hold_slot():
+    async def run():
+        llm = ConcurrencyLimitedLLM(MockLLM(), max_parallel=1)
+
+        # Opened but never iterated
+        await llm.astream_chat(MESSAGES)
+
+        # Would deadlock if the unconsumed stream had taken the only slot
+        await asyncio.wait_for(llm.achat(MESSAGES), timeout=1)
+
+    asyncio.run(run())
+
+
+def test_consumed_stream_releases_slot():
+    async def run():
+        llm = ConcurrencyLimitedLLM(MockLLM(), max_parallel=1)
+
+        stream = await llm.astream_chat(MESSAGES)
+        async for _ in stream:
+            pass
+
+        await asyncio.wait_for(llm.achat(MESSAGES), timeout=1)
+
+    asyncio.run(run())
@@ -0,0 +1,80 @@
+"""Tests for SemanticCache matching."""
+
+import asyncio
+
+from utils.semantic_cache import SemanticCache
+
+VECTORS = {
+    "open settings": [1.0, 0.0],
+    "open the settings": [0.99, 0.1],
+    "go back": [0.0, 1.0],
+    "three dims": [1.0, 0.0, 0.0],
+}
+
+
+async def embed(text):
+    return VECTORS[text]
+
+
+def lookup(cache, text, scope=None):
+    return asyncio.run(cache.lookup(text, scope))
+
+
+def test_similar_prompt_hits():
+    cache = SemanticCache(embed)
+    _, vector = lookup(cache, "open settings")
+    cache.add(vector, {"content": "tap Settings"})
+
+    value, _ = lookup(cache, "open the settings")
+
+    assert value == {"content": "tap Settings"}
+
+
+def test_dissimilar_prompt_misses():
+    cache = SemanticCache(embed)
+    _, vector = lookup(cache, "open settings")
+    cache.add(vector, {"content": "tap Settings"})
+
+    value, _ = lookup(cache, "go back")
+
+    assert value is None
+
+
+def test_different_scope_misses():
+    cache = SemanticCache(embed)
+    _, vector = lookup(cache, "open settings", b"screen-a")
+    cache.add(vector, {"content": "tap Settings"}, b"screen-a")
+
+    assert lookup(cache, "open the settings", b"screen-b")[0] is None
+    assert lookup(cache, "open the settings", b"screen-a")[0] is not None
+
+
+def test_vector_length_mismatch_is_a_miss():
+    cache = SemanticCache(embed)
+    _, vector = lookup(cache, "open settings")
+    cache.add(vector, {"content": "tap Settings"})
+
+    value, vector = lookup(cache, "three dims")
+
+    assert value is None
+    assert vector == [1.0, 0.0, 0.0]
+
+
+def test_embedding_failure_disables_lookup():
+    async def failing_embed(text):
+        raise RuntimeError("endpoint down")
+
+    cache = SemanticCache(failing_embed)
+
+    assert lookup(cache, "open settings") == (None, None)
+
+
+def test_oldest_entry_is_evicted():
+    cache = SemanticCache(embed, max_entries=1)
+    _, settings = lookup(cache, "open settings")
+    cache.add(settings, {"content": "tap Settings"})
+    _, back = lookup(cache, "go back")
+    cache.add(back, {"content": "press Back"})
+
+    assert lookup(cache, "open settings")[0] is None
+    assert lookup(cache, "go back")[0] == {"content": "press Back"}
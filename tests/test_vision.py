@@ -0,0 +1,76 @@
+"""Tests for ScreenshotPreprocessor downscaling and de-duplication."""
+
+import base64
+import io
+
+import pytest
+
+pytest.importorskip("llama_index.core")
+pytest.importorskip("PIL")
+
+from llama_index.core.base.llms.types import ChatMessage, ImageBlock, TextBlock
+from PIL import Image
+
+from utils.vision import SCREEN_UNCHANGED, ScreenshotPreprocessor
+
+
+def png(color: str, size=(1080, 2400)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, color).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def screenshot(data: bytes) -> ChatMessage:
+    return ChatMessage(role="user", blocks=[
+        TextBlock(text="current screen"),
+        ImageBlock(image=data, image_mimetype="image/png"),
+    ])
+
+
+def test_screenshot_is_downscaled_to_jpeg():
+    preprocessor = ScreenshotPreprocessor(max_size=768)
+
+    [message] = preprocessor.process([screenshot(png("red"))])
+    block = message.blocks[1]
+
+    assert block.image_mimetype == "image/jpeg"
+    with Image.open(io.BytesIO(base64.b64decode(block.image))) as img:
+        assert img.format == "JPEG"
+        assert max(img.size) == 768
+
+
+def test_repeated_frame_in_one_request_becomes_marker():
+    preprocessor = ScreenshotPreprocessor()
+    frame = png("red")
+
+    first, second = preprocessor.process([screenshot(frame), screenshot(frame)])
+
+    assert isinstance(first.blocks[1], ImageBlock)
+    assert second.blocks[1] == TextBlock(text=SCREEN_UNCHANGED)
+
+
+def test_frame_is_encoded_once_across_requests(monkeypatch):
+    preprocessor = ScreenshotPreprocessor()
+    encode = preprocessor._encode
+    calls = []
+
+    def counting_encode(source):
+        calls.append(source)
+        return encode(source)
+
+    monkeypatch.setattr(preprocessor, "_encode", counting_encode)
+    frame = png("red")
+
+    first = preprocessor.process([screenshot(frame)])
+    second = preprocessor.process([screenshot(frame)])
+
+    assert len(calls) == 1
+    assert first[0].blocks[1].image == second[0].blocks[1].image
+
+
+def test_text_only_messages_pass_through():
+    preprocessor = ScreenshotPreprocessor()
+    message = ChatMessage(role="user", content="hello")
+
+    assert preprocessor.process([message]) == [message]
+    assert preprocessor.process([message])[0] is message
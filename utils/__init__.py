@@ -1,9 +1,17 @@
 """Multi-device automation utilities for DroidRun."""
 
+from importlib import import_module
+
 from .config_loader import ConfigLoader, TaskConfig
 from .device_manager import DeviceManager
-from .device_logger import DeviceLogger, ConsoleOutput
-from .multi_runner import MultiDeviceRunner
+
+# Imported on first access (PEP 562): the runner pulls in droidrun,
+# llama-index and Pillow, which config-only callers don't need
+_LAZY_ATTRS = {
+    "DeviceLogger": ".device_logger",
+    "ConsoleOutput": ".device_logger",
+    "MultiDeviceRunner": ".multi_runner",
+}
 
 __all__ = [
     "ConfigLoader",
@@ -13,3 +21,12 @@ __all__ = [
     "ConsoleOutput",
     "MultiDeviceRunner",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,57 @@
+"""Reusable in-memory buffers for image encoding."""
+
+import io
+import queue
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class BufferPool:
+    """Fixed-size pool of BytesIO buffers shared across worker threads.
+
+    Buffers are returned without truncation so their allocation is reused
+    by the next encode; callers must track how many bytes they wrote
+    (``buf.tell()``) rather than reading the whole buffer. Buffers that grew
+    past ``max_size`` are replaced on release to bound memory.
+    """
+
+    def __init__(self, size: int, max_size: int = 2 * 1024 * 1024):
+        """Initialize buffer pool.
+
+        Args:
+            size: Number of buffers in the pool.
+            max_size: Largest buffer (in bytes) worth keeping.
+        """
+        self.max_size = max_size
+        self._pool: "queue.SimpleQueue[io.BytesIO]" = queue.SimpleQueue()
+        for _ in range(size):
+            self._pool.put(io.BytesIO())
+
+    def acquire(self) -> io.BytesIO:
+        """Check out a buffer, blocking until one is free.
+
+        Returns:
+            Buffer positioned at offset 0.
+        """
+        buf = self._pool.get()
+        buf.seek(0)
+        return buf
+
+    def release(self, buf: io.BytesIO) -> None:
+        """Return a buffer to the pool.
+
+        Args:
+            buf: Buffer obtained from ``acquire``.
+        """
+        if buf.getbuffer().nbytes > self.max_size:
+            buf = io.BytesIO()
+        self._pool.put(buf)
+
+    @contextmanager
+    def buffer(self) -> Iterator[io.BytesIO]:
+        """Context manager wrapping ``acquire``/``release``."""
+        buf = self.acquire()
+        try:
+            yield buf
+        finally:
+            self.release(buf)
@@ -1,14 +1,20 @@
 """Configuration loader for environment variables and device configs."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
-import yaml
+from threading import Lock
+from typing import Dict, Any, Optional, Set, Tuple
 
+from .text import preview
 
-@dataclass
+# .env files already loaded in this process, keyed by (path, mtime_ns)
+_DOTENV_LOADED: Set[Tuple[str, int]] = set()
+_DOTENV_LOCK = Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class TaskConfig:
     """Task configuration from devices.yaml."""
 
@@ -18,6 +24,28 @@ class TaskConfig:
     reasoning: bool = False
 
 
+@lru_cache(maxsize=8)
+def _load_yaml(path: Path, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on its modification time and size.
+
+    Args:
+        path: YAML file path.
+        mtime_ns: File modification time, used only as part of the cache key.
+        size: File size in bytes, used only as part of the cache key.
+
+    Returns:
+        Parsed YAML document. Shared between callers, treat as read-only.
+    """
+    # Imported here so callers that only need TaskConfig or the API settings
+    # don't pay for loading the YAML parser
+    import yaml
+
+    # Prefer the libyaml C bindings when PyYAML was built with them
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+
 class ConfigLoader:
     """Load and manage configuration from .env and devices.yaml."""
 
@@ -31,9 +59,29 @@ class ConfigLoader:
         self.env_file = self.project_root / ".env"
         self.devices_file = self.project_root / "devices.yaml"
 
+        # Resolved once per loader; environment variables don't change mid-run
+        self._provider: Optional[str] = None
+        self._api_config: Optional[Dict[str, Any]] = None
+        # (parsed config it was built from, task summaries)
+        self._tasks_summary: Optional[Tuple[Dict[str, Any], Dict[str, str]]] = None
+
         # Load environment variables
-        if self.env_file.exists():
+        self._load_env()
+
+    def _load_env(self) -> None:
+        """Load .env once per process (reloaded only if the file changes)."""
+        try:
+            key = (str(self.env_file), self.env_file.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return
+
+        with _DOTENV_LOCK:
+            if key in _DOTENV_LOADED:
+                return
+            from dotenv import load_dotenv
+
             load_dotenv(self.env_file)
+            _DOTENV_LOADED.add(key)
 
     def _get_llm_provider(self) -> str:
         """获取 LLM 提供商类型。
@@ -44,6 +92,9 @@ class ConfigLoader:
         Raises:
             ValueError: 如果提供商名称无效
         """
+        if self._provider is not None:
+            return self._provider
+
         provider = os.getenv("LLM_PROVIDER", "openrouter").lower()
 
         if provider not in ["openrouter", "packyapi"]:
@@ -52,6 +103,7 @@ class ConfigLoader:
                 f"有效值: openrouter, packyapi"
             )
 
+        self._provider = provider
         return provider
 
     def _get_packyapi_config(self) -> Dict[str, Any]:
@@ -91,9 +143,72 @@ class ConfigLoader:
     def get_api_config(self) -> Dict[str, Any]:
         """获取 API 配置（根据 LLM_PROVIDER 自动选择提供商）。
 
+        首次调用成功后结果会被缓存，返回的字典应视为只读。
+
         Returns:
-            字典包含: api_base, api_key, model, needs_custom_transport
+            字典包含: api_base, api_key, model, needs_custom_transport, cache_dir,
+            embedding_model
             - needs_custom_transport (bool): 是否需要自定义 http_client
+            - cache_dir (str | None): LLM 响应缓存目录（LLM_CACHE_DIR），None 表示不缓存
+            - embedding_model (str | None): 语义缓存使用的 embedding 模型
+              （LLM_SEMANTIC_CACHE_MODEL），None 表示不启用语义缓存
+            - image_max_size (int | None): 截图发送前缩放到的最长边像素
+              （LLM_IMAGE_MAX_SIZE），None 表示原图发送
+            - max_parallel (int | None): 所有设备同时进行的 LLM 请求上限
+              （LLM_MAX_PARALLEL），None 表示不限制
+
+        Raises:
+            ValueError: 如果必需的环境变量缺失、取值无效或提供商无效
+        """
+        if self._api_config is not None:
+            return self._api_config
+
+        config = self._get_provider_config()
+        config["cache_dir"] = os.getenv("LLM_CACHE_DIR") or None
+        config["embedding_model"] = os.getenv("LLM_SEMANTIC_CACHE_MODEL") or None
+        config["image_max_size"] = self._get_positive_int(
+            "LLM_IMAGE_MAX_SIZE", "请设置为正整数像素值，例如: LLM_IMAGE_MAX_SIZE=768"
+        )
+        config["max_parallel"] = self._get_positive_int(
+            "LLM_MAX_PARALLEL", "请设置为正整数，例如: LLM_MAX_PARALLEL=4"
+        )
+
+        self._api_config = config
+        return config
+
+    @staticmethod
+    def _get_positive_int(name: str, hint: str) -> Optional[int]:
+        """读取正整数类型的环境变量。
+
+        Args:
+            name: 环境变量名
+            hint: 取值无效时附加在错误信息中的提示
+
+        Returns:
+            环境变量的整数值，未设置时为 None
+
+        Raises:
+            ValueError: 如果取值不是正整数
+        """
+        value = os.getenv(name)
+        if not value:
+            return None
+
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+
+        if number <= 0:
+            raise ValueError(f"无效的 {name}: {value}\n{hint}")
+
+        return number
+
+    def _get_provider_config(self) -> Dict[str, Any]:
+        """获取当前 LLM 提供商的连接配置。
+
+        Returns:
+            字典包含: api_base, api_key, model, needs_custom_transport
 
         Raises:
             ValueError: 如果必需的环境变量缺失或提供商无效
@@ -123,6 +238,9 @@ class ConfigLoader:
     def load_devices_config(self) -> Dict[str, Any]:
         """Load device configuration from devices.yaml.
 
+        The parsed file is cached until its modification time or size changes,
+        so the returned dictionary must be treated as read-only.
+
         Returns:
             Dictionary with devices configuration.
 
@@ -136,9 +254,12 @@ class ConfigLoader:
                 "Please create devices.yaml based on devices.yaml.example"
             )
 
+        import yaml
+
         try:
-            with open(self.devices_file, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            # Size catches rewrites within the filesystem's mtime granularity
+            st = self.devices_file.stat()
+            config = _load_yaml(self.devices_file, st.st_mtime_ns, st.st_size)
 
             if not config or "devices" not in config:
                 raise ValueError("Invalid devices.yaml: 'devices' section is required")
@@ -160,15 +281,17 @@ class ConfigLoader:
         Raises:
             ValueError: If specified device_name not found.
         """
-        config = self.load_devices_config()
-        devices = config.get("devices", {})
+        devices = self.load_devices_config().get("devices", {})
 
         # Single device mode
         if device_name:
-            if device_name not in devices:
+            try:
+                return {device_name: devices[device_name]}
+            except KeyError:
                 available = ", ".join(devices.keys())
-                raise ValueError(f"Device '{device_name}' not found. Available: {available}")
-            return {device_name: devices[device_name]}
+                raise ValueError(
+                    f"Device '{device_name}' not found. Available: {available}"
+                ) from None
 
         # Default: return all enabled devices
         return {
@@ -182,9 +305,18 @@ class ConfigLoader:
 
         Returns:
             Maximum number of concurrent device operations.
+
+        Raises:
+            ValueError: If concurrency is not a positive integer.
         """
         config = self.load_devices_config()
-        return config.get("concurrency", 1)
+        concurrency = config.get("concurrency", 1)
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError(
+                f"Invalid concurrency in devices.yaml: {concurrency!r}. "
+                "Must be a positive integer."
+            )
+        return concurrency
 
     def get_task_config(self, task_name: Optional[str] = None) -> TaskConfig:
         """Get task configuration by name or active task.
@@ -231,12 +363,22 @@ class ConfigLoader:
     def list_tasks(self) -> Dict[str, str]:
         """List all available tasks with their descriptions.
 
+        The summary is rebuilt only when devices.yaml changes; treat the
+        returned dictionary as read-only.
+
         Returns:
             Dictionary mapping task names to their goal summaries.
         """
         config = self.load_devices_config()
+
+        # The parsed config is cached, so the same object means the same file
+        if self._tasks_summary is not None and self._tasks_summary[0] is config:
+            return self._tasks_summary[1]
+
         tasks = config.get("tasks", {})
-        return {
-            name: task.get("goal", "")[:50] + "..."
+        summary = {
+            name: preview(task.get("goal", ""), 50)
             for name, task in tasks.items()
         }
+        self._tasks_summary = (config, summary)
+        return summary
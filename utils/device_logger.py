@@ -1,16 +1,77 @@
 """Device-specific file logging for multi-device execution."""
 
 import logging
+import logging.handlers
+import queue
+import sys
 import time
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional
-from threading import Lock
+from threading import Lock, Thread
+
+from .text import preview
+
+# Records queued ahead of the writer thread before low-priority ones are dropped
+LOG_QUEUE_SIZE = 1024
+
+
+class _DeviceFileRouter(logging.Handler):
+    """Dispatch queued records to the file handler of their device logger."""
+
+    def __init__(self):
+        super().__init__()
+        self.handlers: Dict[str, logging.Handler] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = self.handlers.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue records without ever blocking on a full queue.
+
+    Records of any level that find the queue full are counted and
+    discarded, so a slow disk (or a listener that was never started)
+    cannot stall the agent loop.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() waits for room in a bounded queue."""
+
+    def enqueue_sentinel(self) -> None:
+        # The running listener frees a slot soon; if its thread is gone,
+        # stop() has nothing to wait for and the sentinel can be skipped
+        while True:
+            try:
+                self.queue.put(self._sentinel, timeout=0.1)
+                return
+            except queue.Full:
+                if self._thread is None or not self._thread.is_alive():
+                    return
 
 
 class DeviceLogger:
     """Manage separate log files for each device."""
 
+    # Formatters are stateless, so every device's file handler shares one
+    _FORMATTER = logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S"
+    )
+
     def __init__(self, log_dir: str = "logs"):
         """Initialize device logger.
 
@@ -21,8 +82,17 @@ class DeviceLogger:
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.loggers: Dict[str, logging.Logger] = {}
         self.log_files: Dict[str, Path] = {}
-        self.start_time: Optional[float] = None
+        # Monotonic clock, immune to wall-clock adjustments; reset by start()
+        self.start_time = time.monotonic()
         self._lock = Lock()
+        # One timestamp per session groups all devices' log files by run
+        self.session_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Device loggers only enqueue records; one background thread writes files
+        self._log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._router = _DeviceFileRouter()
+        self._queue_handlers: Dict[str, _DroppingQueueHandler] = {}
+        self._listener: Optional[logging.handlers.QueueListener] = None
 
     def _cleanup_old_logs(self, device_name: str) -> None:
         """Remove old log files for a device, keeping only the latest.
@@ -55,9 +125,7 @@ class DeviceLogger:
                 # Clean up old logs for this device first
                 self._cleanup_old_logs(device_name)
 
-                # Create timestamp for log file
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                log_file = self.log_dir / f"{device_name}_{timestamp}.log"
+                log_file = self.log_dir / f"{device_name}_{self.session_ts}.log"
                 self.log_files[device_name] = log_file
 
                 # Create logger
@@ -65,15 +133,14 @@ class DeviceLogger:
                 logger.setLevel(logging.DEBUG)
                 logger.handlers.clear()  # Remove any existing handlers
 
-                # File handler
+                # File handler, written from the listener thread
                 file_handler = logging.FileHandler(log_file, encoding="utf-8")
                 file_handler.setLevel(logging.DEBUG)
-                formatter = logging.Formatter(
-                    "%(asctime)s [%(levelname)s] %(message)s",
-                    datefmt="%H:%M:%S"
-                )
-                file_handler.setFormatter(formatter)
-                logger.addHandler(file_handler)
+                file_handler.setFormatter(self._FORMATTER)
+                self._router.handlers[logger.name] = file_handler
+                queue_handler = _DroppingQueueHandler(self._log_queue)
+                self._queue_handlers[logger.name] = queue_handler
+                logger.addHandler(queue_handler)
 
                 # Prevent propagation to root logger
                 logger.propagate = False
@@ -94,26 +161,59 @@ class DeviceLogger:
         return self.log_files.get(device_name)
 
     def start(self) -> None:
-        """Start timing."""
-        self.start_time = time.time()
+        """Start timing and the background thread that writes log files.
+
+        Records logged before this call wait in the queue until it runs.
+        """
+        self.start_time = time.monotonic()
+
+        with self._lock:
+            if self._listener is None:
+                self._listener = _QueueListener(
+                    self._log_queue, self._router, respect_handler_level=True
+                )
+                self._listener.start()
 
     def get_elapsed(self) -> float:
         """Get elapsed time in seconds."""
-        if self.start_time:
-            return time.time() - self.start_time
-        return 0.0
+        return time.monotonic() - self.start_time
 
     def close_all(self) -> None:
-        """Close all log file handlers."""
+        """Flush queued records and close all log file handlers."""
         with self._lock:
             for logger in self.loggers.values():
                 for handler in logger.handlers[:]:
                     handler.close()
                     logger.removeHandler(handler)
 
+            # Stopping the listener drains everything already queued
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+
+            for name, file_handler in self._router.handlers.items():
+                # Written directly: the queue is no longer being drained
+                dropped = self._queue_handlers[name].dropped
+                if dropped:
+                    file_handler.handle(logging.makeLogRecord({
+                        "name": name,
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": "Dropped %d log records while the log queue was full",
+                        "args": (dropped,),
+                    }))
+                file_handler.close()
+            self._router.handlers.clear()
+            self._queue_handlers.clear()
+
 
 class ConsoleOutput:
-    """Simple console output for terminal display."""
+    """Simple console output for terminal display.
+
+    Lines are handed to a background writer thread, so terminal writes
+    never block the event loop. The writer flushes stdout whenever it has
+    caught up with the queued output; call ``close`` to drain it.
+    """
 
     def __init__(self, goal: str, concurrency: int, device_count: int):
         """Initialize console output.
@@ -126,19 +226,51 @@ class ConsoleOutput:
         self.goal = goal
         self.concurrency = concurrency
         self.device_count = device_count
-        self.start_time: Optional[float] = None
+        self.start_time = time.monotonic()
+        self._lines: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._writer: Optional[Thread] = None
+
+    def _write(self, text: str) -> None:
+        """Queue text for the writer thread, starting it on first use."""
+        if self._writer is None:
+            self._writer = Thread(
+                target=self._write_lines, name="console-writer", daemon=True
+            )
+            self._writer.start()
+        self._lines.put(text)
+
+    def _write_lines(self) -> None:
+        """Writer thread: copy queued text to stdout until close()."""
+        while True:
+            text = self._lines.get()
+            if text is None:
+                sys.stdout.flush()
+                return
+            sys.stdout.write(text)
+            if self._lines.empty():
+                sys.stdout.flush()
+
+    def close(self) -> None:
+        """Write out everything queued and stop the writer thread."""
+        if self._writer is not None:
+            self._lines.put(None)
+            self._writer.join()
+            self._writer = None
 
     def print_header(self) -> None:
         """Print execution header."""
-        self.start_time = time.time()
-        goal_preview = self.goal[:60] + "..." if len(self.goal) > 60 else self.goal
-
-        print()
-        print("🚀 DroidRun Multi-Device Automation")
-        print(f"📱 Devices: {self.device_count} | ⚙️ Concurrency: {self.concurrency}")
-        print(f"🎯 Goal: {goal_preview}")
-        print("=" * 60)
-        print()
+        self.start_time = time.monotonic()
+        goal_preview = preview(self.goal, 60)
+
+        lines = [
+            "",
+            "🚀 DroidRun Multi-Device Automation",
+            f"📱 Devices: {self.device_count} | ⚙️ Concurrency: {self.concurrency}",
+            f"🎯 Goal: {goal_preview}",
+            "=" * 60,
+            "",
+        ]
+        self._write("\n".join(lines) + "\n")
 
     def print_device_started(self, device_name: str, log_path: Path) -> None:
         """Print device started message.
@@ -147,7 +279,7 @@ class ConsoleOutput:
             device_name: Device name.
             log_path: Path to log file.
         """
-        print(f"[{device_name}] Started → {log_path}")
+        self._write(f"[{device_name}] Started → {log_path}\n")
 
     def print_device_done(
         self,
@@ -167,10 +299,10 @@ class ConsoleOutput:
             error: Error message if failed.
         """
         if success:
-            print(f"[{device_name}] ✅ Done ({steps} steps, {duration:.1f}s)")
+            self._write(f"[{device_name}] ✅ Done ({steps} steps, {duration:.1f}s)\n")
         else:
-            error_msg = f": {error[:50]}" if error else ""
-            print(f"[{device_name}] ❌ Failed{error_msg}")
+            error_msg = f": {preview(error, 50)}" if error else ""
+            self._write(f"[{device_name}] ❌ Failed{error_msg}\n")
 
     def print_summary(self, success_count: int, total_count: int) -> None:
         """Print execution summary.
@@ -179,9 +311,12 @@ class ConsoleOutput:
             success_count: Number of successful devices.
             total_count: Total number of devices.
         """
-        elapsed = time.time() - self.start_time if self.start_time else 0
-
-        print()
-        print("=" * 60)
-        print(f"📊 Summary: {success_count}/{total_count} successful | Total: {elapsed:.1f}s")
-        print()
+        elapsed = time.monotonic() - self.start_time
+
+        lines = [
+            "",
+            "=" * 60,
+            f"📊 Summary: {success_count}/{total_count} successful | Total: {elapsed:.1f}s",
+            "",
+        ]
+        self._write("\n".join(lines) + "\n")
@@ -1,12 +1,19 @@
 """Device connection manager with auto-reconnection support."""
 
 import asyncio
+import re
+import shutil
 import subprocess
-from typing import Dict, List, Any, Optional
+import sys
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+# "<serial> <status> [product:... model:...]" lines of `adb devices`
+_ADB_LINE_RE = re.compile(r"^(\S+)\s+(\S+)")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ConnectedDevice:
     """Represents a connected device."""
 
@@ -19,31 +26,88 @@ class ConnectedDevice:
 class DeviceManager:
     """Manage ADB device connections with auto-reconnection."""
 
-    def __init__(self, max_retry: int = 3, retry_delay: float = 2.0):
+    def __init__(
+        self,
+        max_retry: int = 3,
+        retry_delay: float = 2.0,
+        max_parallel_connections: int = 16,
+        devices_cache_ttl: float = 0.5,
+        max_retry_delay: float = 10.0,
+    ):
         """Initialize device manager.
 
         Args:
             max_retry: Maximum number of reconnection attempts.
-            retry_delay: Delay between retry attempts in seconds.
+            retry_delay: Delay before the first retry in seconds, doubled on each
+                further attempt.
+            max_parallel_connections: Maximum number of devices connecting at once.
+            devices_cache_ttl: Seconds to reuse the `adb devices` snapshot across
+                devices. The snapshot is also dropped after every connect or
+                disconnect.
+            max_retry_delay: Upper bound for the retry delay in seconds.
         """
         self.max_retry = max_retry
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.max_parallel_connections = max_parallel_connections
+        self.devices_cache_ttl = devices_cache_ttl
+        # Resolve the adb binary once instead of on every PATH lookup by exec
+        self._adb = shutil.which("adb") or "adb"
+        # (generation, fetched_at, statuses); only served while its generation
+        # is still current
+        self._device_statuses: Optional[Tuple[int, float, Dict[str, str]]] = None
+        # Bumped whenever a connect/disconnect may have changed the device list
+        self._devices_generation = 0
+        self._devices_lock = asyncio.Lock()
+
+    async def start_server(self) -> None:
+        """Start the adb server up front.
+
+        Concurrent per-device adb commands would otherwise race to fork the
+        daemon on a cold start.
+        """
+        try:
+            await self._run_adb_command(["start-server"])
+        except Exception:
+            # Ignore errors, missing adb is reported by the connection attempts
+            pass
 
     async def connect_all(
-        self, device_configs: Dict[str, Dict[str, Any]]
+        self,
+        device_configs: Dict[str, Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
     ) -> List[ConnectedDevice]:
         """Connect to all devices with auto-reconnection.
 
         Args:
             device_configs: Dictionary of device configurations.
+            max_concurrency: Maximum devices connecting at once. If None, uses
+                max_parallel_connections.
 
         Returns:
             List of successfully connected devices.
         """
-        print(f"🔌 Connecting to {len(device_configs)} device(s)...")
+        if not device_configs:
+            return []
+
+        sys.stdout.write(f"🔌 Connecting to {len(device_configs)} device(s)...\n")
+
+        # Take one status snapshot up front for every device's first probe
+        try:
+            await self._snapshot_device_statuses()
+        except Exception:
+            # Ignore errors, each device retries on its own
+            pass
+
+        # Connect in parallel, capping fan-out so large fleets don't flood adb
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_parallel_connections)
+
+        async def connect_bounded(name: str, config: Dict[str, Any]) -> ConnectedDevice:
+            async with semaphore:
+                return await self._connect_device(name, config)
 
         tasks = [
-            self._connect_device(name, config)
+            asyncio.create_task(connect_bounded(name, config))
             for name, config in device_configs.items()
         ]
 
@@ -54,9 +118,10 @@ class DeviceManager:
             if isinstance(result, ConnectedDevice):
                 connected_devices.append(result)
             elif isinstance(result, Exception):
-                print(f"❌ Connection failed: {result}")
+                sys.stdout.write(f"❌ Connection failed: {result}\n")
 
-        print(f"✅ Successfully connected to {len(connected_devices)}/{len(device_configs)} device(s)")
+        sys.stdout.write(f"✅ Successfully connected to {len(connected_devices)}/{len(device_configs)} device(s)\n")
+        sys.stdout.flush()
         return connected_devices
 
     async def _connect_device(
@@ -77,7 +142,7 @@ class DeviceManager:
         device_type = config.get("type", "unknown")
         description = config.get("description", "")
 
-        print(f"  📱 [{name}] Connecting... ({description})")
+        sys.stdout.write(f"  📱 [{name}] Connecting... ({description})\n")
 
         # Determine serial number based on device type
         if device_type == "wireless":
@@ -92,15 +157,13 @@ class DeviceManager:
             try:
                 # For wireless devices, ensure ADB connection
                 if device_type == "wireless":
-                    await self._ensure_wireless_connection(
-                        config["host"], config["port"]
-                    )
+                    await self._ensure_wireless_connection(serial)
 
                 # Check device status
                 status = await self._get_device_status(serial)
 
                 if status == "device":
-                    print(f"  ✅ [{name}] Connected ({serial})")
+                    sys.stdout.write(f"  ✅ [{name}] Connected ({serial})\n")
                     return ConnectedDevice(
                         name=name,
                         serial=serial,
@@ -108,56 +171,78 @@ class DeviceManager:
                         description=description,
                     )
                 elif status == "offline":
-                    print(f"  ⚠️  [{name}] Device offline, attempting reconnection (attempt {attempt}/{self.max_retry})...")
+                    sys.stdout.write(f"  ⚠️  [{name}] Device offline, attempting reconnection (attempt {attempt}/{self.max_retry})...\n")
                     if device_type == "wireless":
-                        await self._reconnect_wireless(config["host"], config["port"])
-                    await asyncio.sleep(self.retry_delay)
+                        await self._reconnect_wireless(serial)
+                    # No point waiting once the attempts are used up
+                    if attempt < self.max_retry:
+                        await asyncio.sleep(self._retry_delay(attempt))
                 else:
-                    print(f"  ⚠️  [{name}] Device not found, retrying (attempt {attempt}/{self.max_retry})...")
+                    sys.stdout.write(f"  ⚠️  [{name}] Device not found, retrying (attempt {attempt}/{self.max_retry})...\n")
                     if device_type == "wireless":
-                        await self._reconnect_wireless(config["host"], config["port"])
-                    await asyncio.sleep(self.retry_delay)
+                        await self._reconnect_wireless(serial)
+                    if attempt < self.max_retry:
+                        await asyncio.sleep(self._retry_delay(attempt))
 
             except Exception as e:
                 if attempt == self.max_retry:
                     raise ConnectionError(
                         f"Failed to connect to {name} after {self.max_retry} attempts: {e}"
                     )
-                print(f"  ⚠️  [{name}] Error: {e}, retrying...")
-                await asyncio.sleep(self.retry_delay)
+                sys.stdout.write(f"  ⚠️  [{name}] Error: {e}, retrying...\n")
+                await asyncio.sleep(self._retry_delay(attempt))
 
         raise ConnectionError(f"Failed to connect to {name} after {self.max_retry} attempts")
 
-    async def _ensure_wireless_connection(self, host: str, port: int) -> None:
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff delay after a failed attempt.
+
+        Args:
+            attempt: 1-based attempt number that just failed.
+
+        Returns:
+            Delay in seconds, capped at max_retry_delay.
+        """
+        return min(self.retry_delay * 2 ** (attempt - 1), self.max_retry_delay)
+
+    async def _ensure_wireless_connection(self, endpoint: str) -> None:
         """Ensure wireless ADB connection is established.
 
         Args:
-            host: Device IP address.
-            port: Device port number.
+            endpoint: Device address as "host:port".
         """
         try:
             # Try to connect
-            await self._run_adb_command(["connect", f"{host}:{port}"])
+            await self._run_adb_command(["connect", endpoint])
         except Exception:
             # Ignore connection errors, will be handled by status check
             pass
+        finally:
+            # The device list may have changed, don't serve a stale snapshot
+            self._invalidate_device_statuses()
 
-    async def _reconnect_wireless(self, host: str, port: int) -> None:
+    async def _reconnect_wireless(self, endpoint: str) -> None:
         """Reconnect wireless device by disconnecting and connecting again.
 
         Args:
-            host: Device IP address.
-            port: Device port number.
+            endpoint: Device address as "host:port".
         """
         try:
             # Disconnect first
-            await self._run_adb_command(["disconnect", f"{host}:{port}"])
+            await self._run_adb_command(["disconnect", endpoint])
             await asyncio.sleep(1)
             # Reconnect
-            await self._run_adb_command(["connect", f"{host}:{port}"])
+            await self._run_adb_command(["connect", endpoint])
         except Exception:
             # Ignore errors, will be handled by status check
             pass
+        finally:
+            self._invalidate_device_statuses()
+
+    def _invalidate_device_statuses(self) -> None:
+        """Drop the `adb devices` snapshot, including any fetch in flight."""
+        self._devices_generation += 1
+        self._device_statuses = None
 
     async def _get_device_status(self, serial: str) -> Optional[str]:
         """Get device status from adb devices.
@@ -169,23 +254,54 @@ class DeviceManager:
             Device status: "device", "offline", or None if not found.
         """
         try:
-            output = await self._run_adb_command(["devices"])
-            lines = output.strip().split("\n")[1:]  # Skip header line
-
-            for line in lines:
-                if serial in line:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        return parts[1]  # Return status (device, offline, etc.)
-            return None
+            statuses = await self._snapshot_device_statuses()
+            return statuses.get(serial)
         except Exception:
             return None
 
-    async def _run_adb_command(self, args: List[str]) -> str:
+    async def _snapshot_device_statuses(self) -> Dict[str, str]:
+        """Run `adb devices` once and map every serial to its status.
+
+        The snapshot is shared between devices for a short TTL, so N devices
+        probing at once cost a single adb invocation.
+
+        Returns:
+            Dictionary mapping serial to status ("device", "offline", ...).
+        """
+        async with self._devices_lock:
+            now = time.monotonic()
+            generation = self._devices_generation
+            if self._device_statuses is not None:
+                fetched_generation, fetched_at, statuses = self._device_statuses
+                if (
+                    fetched_generation == generation
+                    and now - fetched_at < self.devices_cache_ttl
+                ):
+                    return statuses
+
+            # Status parsing never looks at stderr, skip the extra pipe
+            output = await self._run_adb_command(["devices"], capture_stderr=False)
+            statuses = {}
+            for line in output.splitlines()[1:]:  # Skip header line
+                match = _ADB_LINE_RE.match(line)
+                if match:
+                    statuses[match.group(1)] = match.group(2)
+
+            # A connect that finished while adb was listing devices may be
+            # missing from this output; let the next caller fetch again
+            if generation == self._devices_generation:
+                self._device_statuses = (generation, now, statuses)
+            return statuses
+
+    async def _run_adb_command(
+        self, args: List[str], capture_stderr: bool = True
+    ) -> str:
         """Run ADB command asynchronously.
 
         Args:
             args: ADB command arguments.
+            capture_stderr: Whether to keep stderr for the raised error. If
+                False, stderr is discarded instead of piped.
 
         Returns:
             Command output.
@@ -193,11 +309,11 @@ class DeviceManager:
         Raises:
             subprocess.CalledProcessError: If command fails.
         """
-        cmd = ["adb"] + args
+        cmd = [self._adb, *args]
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL,
         )
 
         stdout, stderr = await process.communicate()
@@ -207,4 +323,4 @@ class DeviceManager:
                 process.returncode, cmd, stdout, stderr
             )
 
-        return stdout.decode("utf-8")
+        return stdout.decode("utf-8", "replace")
@@ -0,0 +1,114 @@
+"""Micro-batching of embedding requests across concurrent devices."""
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+
+class EmbeddingBatcher:
+    """Coalesce single-text embedding calls into batched requests.
+
+    Callers await ``embed(text)``; a background task collects pending texts
+    for up to ``max_wait`` seconds (or ``max_batch`` items) and sends them
+    in one request, then resolves every caller's future.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], Awaitable[List[List[float]]]],
+        max_batch: int = 64,
+        max_wait: float = 0.02,
+    ):
+        """Initialize embedding batcher.
+
+        Args:
+            embed_batch: Coroutine function embedding a list of texts in one call.
+            max_batch: Maximum number of texts per request.
+            max_wait: Maximum time in seconds to wait for a batch to fill.
+        """
+        self._embed_batch = embed_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed one text, batched with any concurrent callers.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            Embedding vector.
+        """
+        if self._worker is None:
+            # Created lazily so the queue binds to the running event loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def _collect(self) -> None:
+        """Gather queued texts into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Send without blocking collection of the next batch
+            task = asyncio.create_task(self._flush(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed one batch and resolve its futures."""
+        try:
+            vectors = await self._embed_batch([text for text, _ in batch])
+        except Exception as e:
+            if len(batch) > 1:
+                # One bad input (e.g. over the token limit) rejects the whole
+                # request; retry individually so only that caller fails
+                await asyncio.gather(*(self._flush([item]) for item in batch))
+                return
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+        # A short response must not leave the unmatched callers waiting forever
+        if len(vectors) < len(batch):
+            error = ValueError(
+                f"Embedding response has {len(vectors)} vectors for {len(batch)} inputs"
+            )
+            for _, future in batch[len(vectors):]:
+                if not future.done():
+                    future.set_exception(error)
+
+    async def aclose(self) -> None:
+        """Stop the background task and wait for in-flight batches."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
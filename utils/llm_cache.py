@@ -0,0 +1,225 @@
+"""On-disk cache for deterministic LLM responses."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import orjson
+from llama_index.core.base.llms.types import (
+    ChatMessage,
+    ChatResponse,
+    CompletionResponse,
+    ImageBlock,
+    TextBlock,
+)
+from llama_index.core.llms import LLM
+from pydantic import PrivateAttr
+
+from .llm_wrapper import LLMWrapper
+from .semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedLLM(LLMWrapper):
+    """Replay identical temperature-0 requests from a JSON file cache.
+
+    Requests are keyed by SHA-256 of (model, messages, call kwargs). Nothing
+    is cached unless the wrapped LLM has ``temperature == 0``, and responses
+    carrying tool calls are never stored. Exact-match caching only covers
+    text-only requests.
+
+    An optional SemanticCache is consulted after an exact-match miss, using
+    the text of the messages. Matches are scoped to a digest of the
+    request's images, so an answer is only reused for the same screens.
+    """
+
+    _cache_dir: Path = PrivateAttr()
+    _semantic_cache: Optional[SemanticCache] = PrivateAttr()
+
+    def __init__(
+        self,
+        inner: LLM,
+        path: str = ".cache/llm",
+        semantic_cache: Optional[SemanticCache] = None,
+        **kwargs: Any,
+    ):
+        """Initialize cached LLM.
+
+        Args:
+            inner: LLM to delegate cache misses to.
+            path: Directory for cached responses.
+            semantic_cache: Optional near-duplicate cache used after exact misses.
+        """
+        super().__init__(inner, **kwargs)
+        self._cache_dir = Path(path)
+        self._semantic_cache = semantic_cache
+
+    def _is_deterministic(self) -> bool:
+        """Check whether the wrapped LLM samples deterministically."""
+        temperature = getattr(self._inner, "temperature", None)
+        return temperature is not None and temperature <= 0
+
+    @staticmethod
+    def _is_text_only(messages: Sequence[ChatMessage]) -> bool:
+        """Check whether a chat request contains nothing but text blocks."""
+        return all(
+            isinstance(block, TextBlock)
+            for message in messages
+            for block in message.blocks
+        )
+
+    @staticmethod
+    def _message_text(messages: Sequence[ChatMessage]) -> str:
+        """Join the text blocks of all messages, skipping images."""
+        return "\n".join(
+            block.text
+            for message in messages
+            for block in message.blocks
+            if isinstance(block, TextBlock)
+        )
+
+    @staticmethod
+    def _message_key(message: ChatMessage) -> Dict[str, Any]:
+        """Describe one message for the cache key.
+
+        additional_kwargs (tool calls, tool call ids, ...) change what the
+        model sees, so they are part of the key whenever present.
+        """
+        entry = {"role": message.role.value, "content": message.content}
+        if message.additional_kwargs:
+            entry["additional_kwargs"] = message.additional_kwargs
+        return entry
+
+    @staticmethod
+    def _image_digest(messages: Sequence[ChatMessage]) -> Optional[bytes]:
+        """Digest every image in a request, or None if it has none."""
+        digest = None
+        for message in messages:
+            for block in message.blocks:
+                if not isinstance(block, ImageBlock):
+                    continue
+                if digest is None:
+                    digest = hashlib.blake2b(digest_size=16)
+                if block.image is not None:
+                    digest.update(block.image)
+                else:
+                    digest.update(str(block.path or block.url).encode())
+                # Separator so adjacent images can't hash like one
+                digest.update(b"\0")
+        return None if digest is None else digest.digest()
+
+    def _make_key(self, payload: Dict[str, Any]) -> str:
+        """Hash a request payload into a cache key."""
+        payload = {"model": self._inner.metadata.model_name, **payload}
+        data = orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        return hashlib.sha256(data).hexdigest()
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read a cached response, or None on miss/corruption."""
+        try:
+            with open(self._cache_dir / f"{key}.json", "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _write(self, key: str, value: Dict[str, Any]) -> None:
+        """Atomically write a cached response.
+
+        Each write goes through its own temporary file, so devices storing
+        the same key at once never share one. Failures are logged and
+        ignored: a lost cache entry must not fail the LLM call.
+        """
+        path = self._cache_dir / f"{key}.json"
+        tmp_name = None
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self._cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                f.write(orjson.dumps(value))
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.warning("Failed to write LLM cache entry %s: %s", path, e)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    async def achat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        if not self._is_deterministic():
+            return await self._inner.achat(messages, **kwargs)
+
+        key = None
+        if self._is_text_only(messages):
+            key = self._make_key({
+                "messages": [self._message_key(message) for message in messages],
+                "kwargs": kwargs,
+            })
+            cached = await asyncio.to_thread(self._read, key)
+            if cached is not None:
+                return self._to_chat_response(cached)
+
+        vector = None
+        scope = None
+        if self._semantic_cache is not None:
+            scope = self._image_digest(messages)
+            cached, vector = await self._semantic_cache.lookup(
+                self._message_text(messages), scope
+            )
+            if cached is not None:
+                return self._to_chat_response(cached)
+
+        response = await self._inner.achat(messages, **kwargs)
+
+        # Tool calls are SDK objects that do not round-trip through JSON
+        if not response.message.additional_kwargs.get("tool_calls"):
+            value = {
+                "role": response.message.role.value,
+                "content": response.message.content,
+            }
+            if key is not None:
+                await asyncio.to_thread(self._write, key, value)
+            if vector is not None:
+                self._semantic_cache.add(vector, value, scope)
+
+        return response
+
+    @staticmethod
+    def _to_chat_response(value: Dict[str, Any]) -> ChatResponse:
+        """Rebuild a ChatResponse from a cached value."""
+        return ChatResponse(
+            message=ChatMessage(role=value["role"], content=value["content"])
+        )
+
+    async def acomplete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponse:
+        if not self._is_deterministic():
+            return await self._inner.acomplete(prompt, formatted=formatted, **kwargs)
+
+        key = self._make_key({
+            "prompt": prompt,
+            "formatted": formatted,
+            "kwargs": kwargs,
+        })
+
+        cached = await asyncio.to_thread(self._read, key)
+        if cached is not None:
+            return CompletionResponse(text=cached["text"])
+
+        response = await self._inner.acomplete(prompt, formatted=formatted, **kwargs)
+        await asyncio.to_thread(self._write, key, {"text": response.text})
+        return response
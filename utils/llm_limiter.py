@@ -0,0 +1,81 @@
+"""Cap the number of LLM requests in flight across all devices."""
+
+import asyncio
+from typing import Any, AsyncGenerator, Awaitable, Callable, Sequence, TypeVar
+
+from llama_index.core.base.llms.types import (
+    ChatMessage,
+    ChatResponse,
+    ChatResponseAsyncGen,
+    CompletionResponse,
+    CompletionResponseAsyncGen,
+)
+from llama_index.core.llms import LLM
+from pydantic import PrivateAttr
+
+from .llm_wrapper import LLMWrapper
+
+T = TypeVar("T")
+
+
+class ConcurrencyLimitedLLM(LLMWrapper):
+    """Allow at most ``max_parallel`` async requests to the wrapped LLM.
+
+    Self-hosted backends (vLLM, Ollama, ...) batch the requests they are
+    serving at once up to their own parallelism limit and queue the rest.
+    Matching the client to that limit keeps excess requests waiting
+    locally instead of timing out in the server queue. Streaming calls
+    take their slot when iteration starts and hold it until the stream is
+    exhausted or closed.
+    """
+
+    _semaphore: asyncio.Semaphore = PrivateAttr()
+
+    def __init__(self, inner: LLM, max_parallel: int, **kwargs: Any):
+        """Initialize concurrency-limited LLM.
+
+        Args:
+            inner: LLM to delegate to.
+            max_parallel: Maximum number of concurrent requests.
+        """
+        super().__init__(inner, **kwargs)
+        self._semaphore = asyncio.Semaphore(max_parallel)
+
+    async def achat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        async with self._semaphore:
+            return await self._inner.achat(messages, **kwargs)
+
+    async def acomplete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponse:
+        async with self._semaphore:
+            return await self._inner.acomplete(prompt, formatted=formatted, **kwargs)
+
+    async def astream_chat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponseAsyncGen:
+        return self._limited_stream(
+            lambda: self._inner.astream_chat(messages, **kwargs)
+        )
+
+    async def astream_complete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponseAsyncGen:
+        return self._limited_stream(
+            lambda: self._inner.astream_complete(prompt, formatted=formatted, **kwargs)
+        )
+
+    async def _limited_stream(
+        self, open_stream: Callable[[], Awaitable[AsyncGenerator[T, None]]]
+    ) -> AsyncGenerator[T, None]:
+        """Open and yield from a stream while holding a slot.
+
+        The slot is taken on first iteration rather than when the stream is
+        handed out, so a stream that is never iterated holds nothing.
+        """
+        async with self._semaphore:
+            stream = await open_stream()
+            async for item in stream:
+                yield item
@@ -0,0 +1,106 @@
+"""Base class for LLMs that wrap and delegate to another llama-index LLM."""
+
+from typing import Any, Sequence
+
+from llama_index.core.base.llms.types import (
+    ChatMessage,
+    ChatResponse,
+    ChatResponseAsyncGen,
+    ChatResponseGen,
+    CompletionResponse,
+    CompletionResponseAsyncGen,
+    CompletionResponseGen,
+    LLMMetadata,
+)
+from llama_index.core.llms import LLM
+from pydantic import PrivateAttr
+
+
+class _ForwardedClassName(property):
+    """``class_name`` that reports the wrapped LLM's name on instances.
+
+    droidrun picks its token-usage parser (and some CodeAct behaviour) from
+    ``llm.class_name()``, so a wrapper must answer with the name of the LLM
+    it wraps. On the class itself it still returns the wrapper's own name.
+    Subclassing property keeps pydantic from treating it as a field.
+    """
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return lambda: objtype.__name__
+        return obj._inner.class_name
+
+
+class LLMWrapper(LLM):
+    """Delegate every call to an inner LLM.
+
+    Subclasses override only the methods they want to intercept (e.g.
+    ``achat``); everything else, including unknown attributes such as
+    ``model``, is forwarded to the wrapped LLM. ``class_name()`` on an
+    instance also reports the wrapped LLM's name.
+    """
+
+    _inner: LLM = PrivateAttr()
+
+    def __init__(self, inner: LLM, **kwargs: Any):
+        """Initialize wrapper.
+
+        Args:
+            inner: LLM to delegate to.
+        """
+        super().__init__(callback_manager=inner.callback_manager, **kwargs)
+        self._inner = inner
+
+    class_name = _ForwardedClassName()
+
+    @property
+    def inner(self) -> LLM:
+        """Wrapped LLM."""
+        return self._inner
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return self._inner.metadata
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            return super().__getattr__(name)
+        return getattr(self._inner, name)
+
+    def chat(self, messages: Sequence[ChatMessage], **kwargs: Any) -> ChatResponse:
+        return self._inner.chat(messages, **kwargs)
+
+    def complete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponse:
+        return self._inner.complete(prompt, formatted=formatted, **kwargs)
+
+    def stream_chat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponseGen:
+        return self._inner.stream_chat(messages, **kwargs)
+
+    def stream_complete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponseGen:
+        return self._inner.stream_complete(prompt, formatted=formatted, **kwargs)
+
+    async def achat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        return await self._inner.achat(messages, **kwargs)
+
+    async def acomplete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponse:
+        return await self._inner.acomplete(prompt, formatted=formatted, **kwargs)
+
+    async def astream_chat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponseAsyncGen:
+        return await self._inner.astream_chat(messages, **kwargs)
+
+    async def astream_complete(
+        self, prompt: str, formatted: bool = False, **kwargs: Any
+    ) -> CompletionResponseAsyncGen:
+        return await self._inner.astream_complete(prompt, formatted=formatted, **kwargs)
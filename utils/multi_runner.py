@@ -1,11 +1,14 @@
 """Multi-device parallel/sequential runner for DroidAgent."""
 
 import asyncio
+import logging
+import os
+import re
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import Callable, List, Dict, Any, Optional
 
+import httpx
 from droidrun import AdbTools, DroidAgent
 from droidrun.agent.droid.events import (
     ExecutorResultEvent,
@@ -19,17 +22,32 @@ from droidrun.agent.codeact.events import (
     TaskExecutionResultEvent,
     TaskEndEvent,
 )
+from llama_index.core.llms import LLM
 from llama_index.llms.openai_like import OpenAILike
-from droidrun.config_manager.config_manager import (
-    DroidrunConfig,
-    AgentConfig,
-    CodeActConfig,
-    ManagerConfig,
-    ExecutorConfig,
-)
+from droidrun.config_manager.config_manager import DroidrunConfig
 
 from .device_manager import ConnectedDevice
 from .device_logger import DeviceLogger, ConsoleOutput
+from .text import preview
+from .llm_cache import CachedLLM
+from .llm_limiter import ConcurrencyLimitedLLM
+from .openai_client import CompatibleAsyncTransport
+from .embedding_batcher import EmbeddingBatcher
+from .semantic_cache import OpenAIEmbedder, SemanticCache
+from .buffer_pool import BufferPool
+from .vision import ScreenshotPreprocessor, VisionLLM
+
+TRAJECTORIES_ROOT = Path("trajectories")
+
+# Execution output that reports a failure; one scan instead of two `in` checks
+_ERROR_RE = re.compile(r"Error|Exception")
+
+# Progress log markers, indexed by a result's success flag
+_OUTCOME = ("✗", "✓")
+_DEFAULT_SUMMARY = "(action completed)"
+
+# Minimum seconds between logged manager thoughts per device
+_THOUGHT_INTERVAL = 1.0
 
 
 class TaskResult:
@@ -56,23 +74,57 @@ class MultiDeviceRunner:
         llm_config: Dict[str, str],
         agent_config: DroidrunConfig,
         concurrency: int = 1,
+        device_timeout_s: Optional[float] = None,
     ):
         """Initialize multi-device runner.
 
         Args:
             devices: List of connected devices.
             goal: Task goal/objective.
-            llm_config: LLM configuration (api_base, api_key, model).
+            llm_config: LLM configuration (see ConfigLoader.get_api_config).
             agent_config: DroidAgent configuration.
             concurrency: Maximum concurrent tasks (1 = sequential).
+            device_timeout_s: Wall-clock budget in seconds for each device's
+                task (None = no limit).
+
+        Raises:
+            ValueError: If concurrency is less than 1.
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
         self.devices = devices
         self.goal = goal
         self.llm_config = llm_config
         self.agent_config = agent_config
         self.concurrency = concurrency
+        self.device_timeout_s = device_timeout_s
+        # Step budget shown in progress logs, resolved once per runner
+        self._max_steps = agent_config.agent.max_steps if agent_config.agent else 100
         self.device_logger: Optional[DeviceLogger] = None
         self.console: Optional[ConsoleOutput] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._semantic_cache: Optional[SemanticCache] = None
+        self._embedding_batcher: Optional[EmbeddingBatcher] = None
+        self._screenshot_preprocessor: Optional[ScreenshotPreprocessor] = None
+        self._llm: Optional[LLM] = None
+        # Logger name -> monotonic time its last manager thought was logged
+        self._last_thought_at: Dict[str, float] = {}
+
+        # Event type -> logging handler (None = not logged), extended with
+        # subclasses as they are first seen
+        self._event_handlers: Dict[type, Optional[Callable[..., Optional[int]]]] = {
+            # CodeAct mode events (direct execution)
+            TaskThinkingEvent: self._on_task_thinking,
+            TaskExecutionEvent: self._on_task_execution,
+            TaskExecutionResultEvent: self._on_task_execution_result,
+            TaskEndEvent: self._on_task_end,
+            # Manager/Executor mode events (reasoning mode)
+            ExecutorResultEvent: self._on_executor_result,
+            ManagerPlanEvent: self._on_manager_plan,
+            CodeActResultEvent: self._on_codeact_result,
+            ScripterExecutorResultEvent: self._on_scripter_result,
+        }
 
     async def run_all(self) -> List[TaskResult]:
         """Run tasks on all devices with concurrency control.
@@ -88,53 +140,163 @@ class MultiDeviceRunner:
             device_count=len(self.devices),
         )
 
-        # Print header
-        self.console.print_header()
-        self.device_logger.start()
-
+        # Everything below is torn down in finally, even if setup fails
         try:
-            # Create semaphore for concurrency control
-            semaphore = asyncio.Semaphore(self.concurrency)
-
-            # Create tasks for all devices
-            tasks = [
-                self._run_device_task(device, semaphore)
-                for device in self.devices
-            ]
-
-            # Run all tasks and gather results
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            task_results = []
-            for result in results:
-                if isinstance(result, TaskResult):
-                    task_results.append(result)
-                elif isinstance(result, Exception):
-                    err_result = TaskResult("unknown")
-                    err_result.error = str(result)
-                    task_results.append(err_result)
+            # Print header
+            self.console.print_header()
+            self.device_logger.start()
+
+            # One connection pool for every device's LLM calls
+            self._http_client = self._create_http_client()
+            self._semantic_cache = self._create_semantic_cache()
+
+            # Encoded screenshots are content-addressed, so devices can share them
+            image_max_size = self.llm_config.get("image_max_size")
+            if image_max_size:
+                self._screenshot_preprocessor = ScreenshotPreprocessor(
+                    max_size=image_max_size,
+                    buffer_pool=BufferPool(self.concurrency + 4),
+                )
+
+            self._llm = self._create_llm()
 
+            task_results = await self._run_workers()
+
+            # Print summary
+            success_count = sum(1 for r in task_results if r.success)
+            self.console.print_summary(success_count, len(task_results))
         finally:
+            if self._embedding_batcher is not None:
+                await self._embedding_batcher.aclose()
+            if self._http_client is not None:
+                await self._http_client.aclose()
             # Close all log handlers
             self.device_logger.close_all()
-
-        # Print summary
-        success_count = sum(1 for r in task_results if r.success)
-        self.console.print_summary(success_count, len(task_results))
+            # Drain console output last so nothing queued is lost
+            self.console.close()
 
         return task_results
 
-    async def _run_device_task(
-        self,
-        device: ConnectedDevice,
-        semaphore: asyncio.Semaphore,
-    ) -> TaskResult:
+    async def _run_workers(self) -> List[TaskResult]:
+        """Run device tasks on a fixed pool of `concurrency` workers.
+
+        Each worker pulls the next device from a shared queue as soon as its
+        previous task finishes, so exactly `concurrency` tasks are in flight
+        without a semaphore gating every device.
+
+        Returns:
+            TaskResult objects in device order.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, device in enumerate(self.devices):
+            queue.put_nowait((index, device))
+
+        results: List[Optional[TaskResult]] = [None] * len(self.devices)
+
+        async def worker() -> None:
+            # The queue is filled up front, so empty means all work is taken
+            while not queue.empty():
+                index, device = queue.get_nowait()
+                try:
+                    results[index] = await self._run_device_task(device)
+                except Exception as e:
+                    err_result = TaskResult(device.name)
+                    err_result.error = str(e)
+                    results[index] = err_result
+
+        # TaskGroup cancels and awaits every worker if the run is interrupted
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(min(self.concurrency, len(self.devices))):
+                task_group.create_task(worker())
+
+        return results
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create the async HTTP client shared by all devices.
+
+        Returns:
+            httpx.AsyncClient with a pool sized to the configured concurrency.
+        """
+        limits = httpx.Limits(
+            max_connections=self.concurrency * 4,
+            max_keepalive_connections=self.concurrency * 2,
+        )
+
+        # 根据配置决定是否使用自定义传输层
+        if self.llm_config.get("needs_custom_transport", False):
+            # PackyAPI 需要修改 User-Agent 以避免被拦截
+            # 使用异步传输层（因为 DroidAgent 在异步环境中运行）
+            return httpx.AsyncClient(transport=CompatibleAsyncTransport(limits=limits))
+
+        return httpx.AsyncClient(limits=limits)
+
+    def _create_semantic_cache(self) -> Optional[SemanticCache]:
+        """Create the semantic cache shared by all devices, if configured.
+
+        Returns:
+            SemanticCache, or None unless both cache_dir and embedding_model are set.
+        """
+        embedding_model = self.llm_config.get("embedding_model")
+        if not (self.llm_config.get("cache_dir") and embedding_model):
+            return None
+
+        embedder = OpenAIEmbedder(
+            http_client=self._http_client,
+            api_base=self.llm_config["api_base"],
+            api_key=self.llm_config["api_key"],
+            model=embedding_model,
+        )
+
+        # Concurrent devices share one embedding request per batching window
+        self._embedding_batcher = EmbeddingBatcher(embedder.embed)
+        return SemanticCache(self._embedding_batcher.embed)
+
+    def _create_llm(self) -> LLM:
+        """Create the LLM shared by all devices.
+
+        The client and its wrappers hold no per-device state, so one
+        instance serves every agent.
+
+        Returns:
+            OpenAILike LLM, wrapped in ConcurrencyLimitedLLM/CachedLLM/VisionLLM
+            when configured.
+        """
+        # 响应缓存只对确定性调用有效，启用时使用 temperature=0
+        cache_dir = self.llm_config.get("cache_dir")
+        llm_kwargs = {"temperature": 0.0} if cache_dir else {}
+
+        # 所有设备共享同一个 HTTP 连接池
+        llm = OpenAILike(
+            api_base=self.llm_config["api_base"],
+            api_key=self.llm_config["api_key"],
+            model=self.llm_config["model"],
+            is_chat_model=True,
+            async_http_client=self._http_client,
+            **llm_kwargs,
+        )
+
+        # Innermost, so cache hits never take a request slot
+        max_parallel = self.llm_config.get("max_parallel")
+        if max_parallel:
+            llm = ConcurrencyLimitedLLM(llm, max_parallel)
+
+        if cache_dir:
+            llm = CachedLLM(
+                llm,
+                path=cache_dir,
+                semantic_cache=self._semantic_cache,
+            )
+
+        if self._screenshot_preprocessor is not None:
+            llm = VisionLLM(llm, self._screenshot_preprocessor)
+
+        return llm
+
+    async def _run_device_task(self, device: ConnectedDevice) -> TaskResult:
         """Run task on a single device.
 
         Args:
             device: Connected device.
-            semaphore: Semaphore for concurrency control.
 
         Returns:
             TaskResult object.
@@ -149,60 +311,54 @@ class MultiDeviceRunner:
         # Print started message
         self.console.print_device_started(device.name, log_path)
 
-        logger.info(f"Task started for device: {device.name}")
-        logger.info(f"Serial: {device.serial}")
-        logger.info(f"Type: {device.device_type}")
-        logger.info(f"Description: {device.description}")
-        logger.info(f"Goal: {self.goal}")
+        logger.info("Task started for device: %s", device.name)
+        logger.info("Serial: %s", device.serial)
+        logger.info("Type: %s", device.device_type)
+        logger.info("Description: %s", device.description)
+        logger.info("Goal: %s", self.goal)
         logger.info("-" * 40)
 
-        async with semaphore:
-            start_time = time.time()
+        start_time = time.time()
+        # A hung ADB call or stalled LLM stream must not hold a worker forever
+        deadline = asyncio.timeout(self.device_timeout_s)
 
-            try:
+        try:
+            async with deadline:
                 # Initialize tools
                 logger.info("Initializing ADB tools...")
-                tools = AdbTools(serial=device.serial)
+                # AdbTools talks to the device synchronously, keep it off the event loop
+                tools = await asyncio.to_thread(AdbTools, serial=device.serial)
 
-                # Initialize LLM
-                logger.info(f"Initializing LLM: {self.llm_config['model']}")
+                # The LLM is shared, only record its settings for this device
+                logger.info("Using shared LLM: %s", self.llm_config["model"])
 
-                # 根据配置决定是否使用自定义 http_client
                 if self.llm_config.get("needs_custom_transport", False):
-                    # PackyAPI 需要修改 User-Agent 以避免被拦截
-                    from utils.openai_client import CompatibleAsyncTransport
-                    import httpx
-
                     logger.info("Using custom async HTTP transport for API compatibility")
-                    # 使用异步 HTTP 客户端（因为 DroidAgent 在异步环境中运行）
-                    async_http_client = httpx.AsyncClient(transport=CompatibleAsyncTransport())
-                    llm = OpenAILike(
-                        api_base=self.llm_config["api_base"],
-                        api_key=self.llm_config["api_key"],
-                        model=self.llm_config["model"],
-                        is_chat_model=True,
-                        async_http_client=async_http_client,
-                    )
-                else:
-                    # OpenRouter 或其他标准提供商
-                    llm = OpenAILike(
-                        api_base=self.llm_config["api_base"],
-                        api_key=self.llm_config["api_key"],
-                        model=self.llm_config["model"],
-                        is_chat_model=True,
+
+                cache_dir = self.llm_config.get("cache_dir")
+                if cache_dir:
+                    logger.info("Using LLM response cache: %s", cache_dir)
+
+                max_parallel = self.llm_config.get("max_parallel")
+                if max_parallel:
+                    logger.info("LLM requests limited to %s in flight", max_parallel)
+
+                if self._screenshot_preprocessor is not None:
+                    logger.info(
+                        "Downscaling screenshots to %spx JPEG",
+                        self._screenshot_preprocessor.max_size,
                     )
 
-                # Create trajectory folder
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                trajectory_path = Path("trajectories") / f"{device.name}_{timestamp}"
-                result.trajectory_path = str(trajectory_path)
+                # Create trajectory folder, stamped like this run's log files
+                trajectory_path = TRAJECTORIES_ROOT / f"{device.name}_{self.device_logger.session_ts}"
+                result.trajectory_path = os.fspath(trajectory_path)
 
                 # Create agent
                 logger.info("Creating DroidAgent...")
                 agent = DroidAgent(
                     goal=self.goal,
                     timeout=10000,
-                    llms=llm,
+                    llms=self._llm,
                     tools=tools,
                     config=self.agent_config,
                 )
@@ -216,24 +372,28 @@ class MultiDeviceRunner:
                 result.output = agent_result.get("output", "")
                 result.duration = time.time() - start_time
 
-                # Get steps used
-                if hasattr(agent, "shared_state") and hasattr(agent.shared_state, "step_number"):
-                    result.steps_used = agent.shared_state.step_number
+                # Get steps used (stays 0 if the agent exposes no step counter)
+                shared_state = getattr(agent, "shared_state", None)
+                result.steps_used = getattr(shared_state, "step_number", result.steps_used)
 
                 logger.info("-" * 40)
-                logger.info(f"Task completed: success={result.success}")
-                logger.info(f"Steps: {result.steps_used}")
-                logger.info(f"Duration: {result.duration:.1f}s")
+                logger.info("Task completed: success=%s", result.success)
+                logger.info("Steps: %s", result.steps_used)
+                logger.info("Duration: %.1fs", result.duration)
                 if result.output:
-                    logger.info(f"Output: {result.output}")
-
-            except Exception as e:
-                result.success = False
+                    logger.info("Output: %s", result.output)
+
+        except Exception as e:
+            result.success = False
+            result.duration = time.time() - start_time
+            # Only our own deadline counts as a device timeout; a TimeoutError
+            # raised by the agent or tools is an ordinary failure
+            if isinstance(e, TimeoutError) and deadline.expired():
+                result.error = "timeout"
+                logger.error("Task timed out after %.1fs", result.duration)
+            else:
                 result.error = str(e)
-                result.duration = time.time() - start_time
-                logger.error(f"Task failed: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+                logger.exception("Task failed: %s", e)
 
         # Print completion message
         self.console.print_device_done(
@@ -250,7 +410,7 @@ class MultiDeviceRunner:
         self,
         agent: DroidAgent,
         device_name: str,
-        logger: "logging.Logger",  # noqa: F821
+        logger: logging.Logger,
     ) -> Dict[str, Any]:
         """Run agent and log progress.
 
@@ -267,78 +427,175 @@ class MultiDeviceRunner:
 
         last_step = 0
 
-        max_steps = self.agent_config.agent.max_steps if self.agent_config.agent else 100
-
-        # Stream events to log progress
-        async for event in handler.stream_events():
-            # Log based on event type
-
-            # === CodeAct mode events (direct execution) ===
-            if isinstance(event, TaskThinkingEvent):
-                # Agent is thinking and generating code
-                current_step = agent.shared_state.step_number if hasattr(agent, "shared_state") else last_step
-                if event.thoughts:
-                    thought_preview = event.thoughts[:200] + "..." if len(event.thoughts) > 200 else event.thoughts
-                    logger.info(f"Step {current_step + 1}/{max_steps} [Thinking]: {thought_preview}")
-                if event.code:
-                    code_preview = event.code[:150] + "..." if len(event.code) > 150 else event.code
-                    logger.debug(f"  Code: {code_preview}")
-
-            elif isinstance(event, TaskExecutionEvent):
-                # Agent is executing code
-                current_step = agent.shared_state.step_number if hasattr(agent, "shared_state") else last_step
-                code_preview = event.code[:100] + "..." if len(event.code) > 100 else event.code
-                logger.info(f"Step {current_step + 1}/{max_steps} [Executing]: {code_preview}")
-
-            elif isinstance(event, TaskExecutionResultEvent):
-                # Code execution result
-                current_step = agent.shared_state.step_number if hasattr(agent, "shared_state") else last_step
-                output = str(event.output) if event.output else ""
-                if "Error" in output or "Exception" in output:
-                    output_preview = output[:150] + "..." if len(output) > 150 else output
-                    logger.warning(f"Step {current_step + 1}/{max_steps} [Error]: {output_preview}")
-                else:
-                    output_preview = output[:150] + "..." if len(output) > 150 else output
-                    logger.info(f"Step {current_step + 1}/{max_steps} [Result]: {output_preview}")
-                last_step = current_step + 1
-
-            elif isinstance(event, TaskEndEvent):
-                # Task ended
-                outcome = "✓" if event.success else "✗"
-                logger.info(f"Task [{outcome}]: {event.reason}")
-
-            # === Manager/Executor mode events (reasoning mode) ===
-            elif isinstance(event, ExecutorResultEvent):
-                # Executor completed an action
-                current_step = agent.shared_state.step_number if hasattr(agent, "shared_state") else last_step
-                summary = event.summary or "(action completed)"
-                outcome = "✓" if event.outcome else "✗"
-                logger.info(f"Step {current_step}/{max_steps} [{outcome}]: {summary}")
-                if event.error:
-                    logger.warning(f"  Error: {event.error}")
-                last_step = current_step
-
-            elif isinstance(event, ManagerPlanEvent):
-                # Manager made a plan
-                if event.current_subgoal:
-                    logger.info(f"Subgoal: {event.current_subgoal}")
-                if event.thought:
-                    thought_preview = event.thought[:150] + "..." if len(event.thought) > 150 else event.thought
-                    logger.debug(f"Thought: {thought_preview}")
-
-            elif isinstance(event, CodeActResultEvent):
-                # CodeAct mode result
-                current_step = agent.shared_state.step_number if hasattr(agent, "shared_state") else last_step
-                outcome = "✓" if event.success else "✗"
-                logger.info(f"Step {current_step}/{max_steps} [{outcome}]: {event.reason}")
-                last_step = current_step
-
-            elif isinstance(event, ScripterExecutorResultEvent):
-                # Scripter result
-                outcome = "✓" if event.success else "✗"
-                logger.info(f"Script [{outcome}]: {event.message}")
-
-        # Wait for final result
-        result = await handler
+        max_steps = self._max_steps
+
+        # Resolved once: the agent keeps the same state object for the whole run
+        shared_state = getattr(agent, "shared_state", None)
+
+        try:
+            # Stream events to log progress
+            async for event in handler.stream_events():
+                log_event = self._event_handler(type(event))
+                if log_event is None:
+                    continue
+
+                current_step = shared_state.step_number if shared_state is not None else last_step
+                step = log_event(event, logger, current_step, max_steps)
+                if step is not None:
+                    last_step = step
+
+            # Wait for final result
+            result = await handler
+        except asyncio.CancelledError:
+            # Timed out or interrupted: stop the workflow instead of leaving it running
+            await handler.cancel_run()
+            raise
 
         return result
+
+    def _event_handler(self, event_type: type) -> Optional[Callable[..., Optional[int]]]:
+        """Find the logging handler for an event type.
+
+        Subclasses of a registered event resolve to its handler; the answer
+        is memoized per type, so each event costs a single dict lookup.
+
+        Args:
+            event_type: Type of the streamed event.
+
+        Returns:
+            Handler, or None if the event is not logged.
+        """
+        try:
+            return self._event_handlers[event_type]
+        except KeyError:
+            pass
+
+        log_event = None
+        for base in event_type.__mro__[1:]:
+            log_event = self._event_handlers.get(base)
+            if log_event is not None:
+                break
+
+        self._event_handlers[event_type] = log_event
+        return log_event
+
+    # Event handlers: log one event and return the new last step, if it moved.
+
+    def _on_task_thinking(
+        self,
+        event: TaskThinkingEvent,
+        logger: logging.Logger,
+        current_step: int,
+        max_steps: int,
+    ) -> Optional[int]:
+        # Agent is thinking and generating code
+        if event.thoughts:
+            logger.info(
+                "Step %s/%s [Thinking]: %s",
+                current_step + 1, max_steps, preview(event.thoughts, 200),
+            )
+        # Skip building the preview when debug output is off
+        if event.code and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Code: %s", preview(event.code, 150))
+        return None
+
+    def _on_task_execution(
+        self,
+        event: TaskExecutionEvent,
+        logger: logging.Logger,
+        current_step: int,
+        max_steps: int,
+    ) -> Optional[int]:
+        # Agent is executing code
+        logger.info(
+            "Step %s/%s [Executing]: %s",
+            current_step + 1, max_steps, preview(event.code, 100),
+        )
+        return None
+
+    def _on_task_execution_result(
+        self,
+        event: TaskExecutionResultEvent,
+        logger: logging.Logger,
+        current_step: int,
+        max_steps: int,
+    ) -> Optional[int]:
+        # Code execution result
+        output = event.output
+        if not isinstance(output, str):
+            output = str(output) if output else ""
+        output_preview = preview(output, 150)
+        if _ERROR_RE.search(output):
+            logger.warning("Step %s/%s [Error]: %s", current_step + 1, max_steps, output_preview)
+        else:
+            logger.info("Step %s/%s [Result]: %s", current_step + 1, max_steps, output_preview)
+        return current_step + 1
+
+    def _on_task_end(
+        self,
+        event: TaskEndEvent,
+        logger: logging.Logger,
+        current_step: int,
+        max_steps: int,
+    ) -> Optional[int]:
+        # Task ended
+        outcome = _OUTCOME[bool(event.success)]
+        logger.info("Task [%s]: %s", outcome, event.reason)
+        return None
+
+    def _on_executor_result(
+        self,
+        event: ExecutorResultEvent,
+        logger: logging.Logger,
+        current_step: int,
+        max_steps: int,
+    ) -> Optional[int]:
+        # Executor completed an action (reasoning mode)
+        summary = event.summary or _DEFAULT_SUMMARY
+        outcome = _OUTCOME[bool(event.outcome)]
+        logger.info("Step %s/%s [%s]: %s", current_step, max_steps, outcome, summary)
+        if event.error:
+            logger.warning("  Error: %s", event.error)
+        return current_step
+
+    def _on_manager_plan(
+        self,
+        event: ManagerPlanEvent,
+        logger: logging.Logger,
+        current_step: int,
+        max_steps: int,
+    ) -> Optional[int]:
+        # Manager made a plan (reasoning mode)
+        if event.current_subgoal:
+            logger.info("Subgoal: %s", event.current_subgoal)
+        if event.thought and logger.isEnabledFor(logging.DEBUG):
+            # Planning can emit thoughts in bursts; keep at most one per interval
+            now = time.monotonic()
+            if now - self._last_thought_at.get(logger.name, float("-inf")) >= _THOUGHT_INTERVAL:
+                self._last_thought_at[logger.name] = now
+                logger.debug("Thought: %s", preview(event.thought, 150))
+        return None
+
+    def _on_codeact_result(
+        self,
+        event: CodeActResultEvent,
+        logger: logging.Logger,
+        current_step: int,
+        max_steps: int,
+    ) -> Optional[int]:
+        # CodeAct mode result
+        outcome = _OUTCOME[bool(event.success)]
+        logger.info("Step %s/%s [%s]: %s", current_step, max_steps, outcome, event.reason)
+        return current_step
+
+    def _on_scripter_result(
+        self,
+        event: ScripterExecutorResultEvent,
+        logger: logging.Logger,
+        current_step: int,
+        max_steps: int,
+    ) -> Optional[int]:
+        # Scripter result
+        outcome = _OUTCOME[bool(event.success)]
+        logger.info("Script [%s]: %s", outcome, event.message)
+        return None
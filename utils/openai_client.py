@@ -3,7 +3,9 @@
 
 本模块提供：
 - CompatibleTransport: 自定义传输层，修改 User-Agent 以兼容第三方 API
-- create_client(): 按需创建 OpenAI 客户端的工具函数
+- create_client(): 获取 OpenAI 客户端的工具函数（同一配置在进程内复用同一个客户端）
+- create_async_client(): 获取 AsyncOpenAI 异步客户端（同样按配置复用）
+- close_all_clients() / aclose_all_clients(): 关闭所有已缓存的同步 / 异步客户端
 
 使用方法：
     from utils.openai_client import create_client
@@ -19,20 +21,37 @@
     )
 """
 import os
+import threading
+from typing import Dict, Optional, Tuple
+
 import httpx
-from openai import OpenAI
-from dotenv import load_dotenv
+from openai import AsyncOpenAI, OpenAI
+
 
-load_dotenv()
+# 通用浏览器标识，避免被识别为 OpenAI SDK。
+# OpenAI SDK 会在构建每个请求时写入自己的 User-Agent，覆盖 httpx 客户端的默认请求头，
+# 因此只能在传输层发送前替换
+COMPATIBLE_USER_AGENT = 'Mozilla/5.0 (compatible; APIClient/1.0)'
+
+# create_client() / create_async_client() 使用的连接池上限
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30,
+)
 
 
 class CompatibleTransport(httpx.HTTPTransport):
     """
     自定义传输层（同步），修改 User-Agent 以兼容第三方 API 服务
+
+    默认对连接失败重试 1 次（retries=1），其余参数原样传给 httpx.HTTPTransport
     """
+    def __init__(self, retries: int = 1, **kwargs):
+        super().__init__(retries=retries, **kwargs)
+
     def handle_request(self, request):
-        # 修改 User-Agent 为通用浏览器标识，避免被识别为 OpenAI SDK
-        request.headers['user-agent'] = 'Mozilla/5.0 (compatible; APIClient/1.0)'
+        request.headers['user-agent'] = COMPATIBLE_USER_AGENT
         return super().handle_request(request)
 
 
@@ -40,20 +59,50 @@ class CompatibleAsyncTransport(httpx.AsyncHTTPTransport):
     """
     自定义异步传输层，修改 User-Agent 以兼容第三方 API 服务
     用于异步环境（如 DroidRun 的 MultiDeviceRunner）
+
+    默认对连接失败重试 1 次（retries=1），其余参数原样传给 httpx.AsyncHTTPTransport
     """
+    def __init__(self, retries: int = 1, **kwargs):
+        super().__init__(retries=retries, **kwargs)
+
     async def handle_async_request(self, request):
-        # 修改 User-Agent 为通用浏览器标识，避免被识别为 OpenAI SDK
-        request.headers['user-agent'] = 'Mozilla/5.0 (compatible; APIClient/1.0)'
+        request.headers['user-agent'] = COMPATIBLE_USER_AGENT
         return await super().handle_async_request(request)
 
 
+# 已创建的客户端，按 (api_key, base_url, use_custom_transport) 缓存，
+# 使同一端点在整个进程内共享一个连接池
+_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str], bool], OpenAI] = {}
+_ASYNC_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str], bool], AsyncOpenAI] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# .env 在第一次创建客户端时才读取，导入本模块不产生文件 IO
+_dotenv_loaded = False
+
+
+def _ensure_dotenv() -> None:
+    """
+    首次调用时加载 .env 到环境变量，之后不再重复读取
+    """
+    global _dotenv_loaded
+    with _CLIENT_LOCK:
+        if not _dotenv_loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _dotenv_loaded = True
+
+
 def create_client(
     api_key: str = None,
     base_url: str = None,
     use_custom_transport: bool = True
 ) -> OpenAI:
     """
-    创建 OpenAI 客户端
+    获取 OpenAI 客户端
+
+    相同参数的调用返回同一个客户端实例（复用其 HTTP 连接池），
+    不要对返回的客户端调用 close()，进程退出前使用 close_all_clients() 统一关闭。
 
     Args:
         api_key: API 密钥，默认从环境变量 OPENAI_API_KEY 读取
@@ -63,11 +112,102 @@ def create_client(
     Returns:
         OpenAI 客户端实例
     """
+    _ensure_dotenv()
     api_key = api_key or os.getenv("OPENAI_API_KEY")
     base_url = base_url or os.getenv("OPENAI_BASE_URL")
+    key = (api_key, base_url, use_custom_transport)
+
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _build_client(api_key, base_url, use_custom_transport)
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def close_all_clients() -> None:
+    """
+    关闭 create_client() 缓存的所有客户端及其连接池
+    """
+    with _CLIENT_LOCK:
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+
+
+def _build_client(
+    api_key: Optional[str],
+    base_url: Optional[str],
+    use_custom_transport: bool
+) -> OpenAI:
+    """
+    创建新的 OpenAI 客户端（不经过缓存）
+
+    Args:
+        api_key: API 密钥
+        base_url: API 基础 URL
+        use_custom_transport: 是否使用自定义传输层
 
+    Returns:
+        OpenAI 客户端实例
+    """
     if use_custom_transport:
-        http_client = httpx.Client(transport=CompatibleTransport())
+        # 指定 transport 时 httpx.Client 会忽略 limits，连接池上限需设置在传输层上
+        http_client = httpx.Client(transport=CompatibleTransport(limits=DEFAULT_LIMITS))
         return OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
     else:
-        return OpenAI(api_key=api_key, base_url=base_url)
+        http_client = httpx.Client(limits=DEFAULT_LIMITS)
+        return OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+
+def create_async_client(
+    api_key: str = None,
+    base_url: str = None,
+    use_custom_transport: bool = True
+) -> AsyncOpenAI:
+    """
+    获取 AsyncOpenAI 异步客户端
+
+    与 create_client() 相同，相同参数的调用返回同一个客户端实例。
+    异步连接池绑定在首次使用它的事件循环上，只应在同一个事件循环中使用，
+    事件循环结束前使用 aclose_all_clients() 统一关闭。
+
+    Args:
+        api_key: API 密钥，默认从环境变量 OPENAI_API_KEY 读取
+        base_url: API 基础 URL，默认从环境变量 OPENAI_BASE_URL 读取
+        use_custom_transport: 是否使用自定义异步传输层（用于兼容第三方服务），默认 True
+
+    Returns:
+        AsyncOpenAI 客户端实例
+    """
+    _ensure_dotenv()
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    base_url = base_url or os.getenv("OPENAI_BASE_URL")
+    key = (api_key, base_url, use_custom_transport)
+
+    with _CLIENT_LOCK:
+        client = _ASYNC_CLIENT_CACHE.get(key)
+        if client is None:
+            if use_custom_transport:
+                http_client = httpx.AsyncClient(
+                    transport=CompatibleAsyncTransport(limits=DEFAULT_LIMITS)
+                )
+            else:
+                http_client = httpx.AsyncClient(limits=DEFAULT_LIMITS)
+            client = AsyncOpenAI(
+                api_key=api_key, base_url=base_url, http_client=http_client
+            )
+            _ASYNC_CLIENT_CACHE[key] = client
+        return client
+
+
+async def aclose_all_clients() -> None:
+    """
+    关闭 create_async_client() 缓存的所有异步客户端及其连接池
+    """
+    with _CLIENT_LOCK:
+        clients = list(_ASYNC_CLIENT_CACHE.values())
+        _ASYNC_CLIENT_CACHE.clear()
+
+    for client in clients:
+        await client.close()
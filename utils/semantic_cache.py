@@ -0,0 +1,168 @@
+"""In-memory semantic cache for near-duplicate LLM prompts."""
+
+import asyncio
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+
+class OpenAIEmbedder:
+    """Fetch embeddings from an OpenAI-compatible `/embeddings` endpoint."""
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        api_base: str,
+        api_key: str,
+        model: str,
+    ):
+        """Initialize embedder.
+
+        Args:
+            http_client: Shared async HTTP client.
+            api_base: API base URL (e.g. https://openrouter.ai/api/v1).
+            api_key: API key.
+            model: Embedding model name.
+        """
+        self.http_client = http_client
+        self.url = f"{api_base.rstrip('/')}/embeddings"
+        self.headers = {"Authorization": f"Bearer {api_key}"}
+        self.model = model
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts in one request.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One embedding vector per input text, in input order.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        response = await self.http_client.post(
+            self.url,
+            headers=self.headers,
+            json={"model": self.model, "input": texts},
+        )
+        response.raise_for_status()
+        data = sorted(response.json()["data"], key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    """Scale a vector to unit length so dot product equals cosine similarity."""
+    norm = math.sqrt(math.sumprod(vector, vector))
+    if norm == 0:
+        return vector
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """Return cached responses for prompts whose embeddings are close enough.
+
+    Entries expire after ``ttl`` seconds. Lookups are a linear scan over at
+    most ``max_entries`` vectors, which is plenty for a single run; the scan
+    runs in a worker thread so it never stalls the event loop.
+
+    Entries can be tagged with a ``scope`` (e.g. a digest of the screenshots
+    in the request); a lookup only matches entries with the same scope, so
+    a similar prompt about a different screen is never answered from cache.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[List[float]]],
+        threshold: float = 0.93,
+        ttl: float = 3600.0,
+        max_entries: int = 1024,
+    ):
+        """Initialize semantic cache.
+
+        Args:
+            embed: Coroutine function returning the embedding for one text.
+            threshold: Minimum cosine similarity for a hit.
+            ttl: Entry lifetime in seconds.
+            max_entries: Maximum number of cached entries (oldest evicted first).
+        """
+        self._embed = embed
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # (added_at, vector, scope, value)
+        self._entries: List[Tuple[float, List[float], Optional[bytes], Dict[str, Any]]] = []
+
+    def _prune(self) -> None:
+        """Drop expired entries."""
+        cutoff = time.monotonic() - self.ttl
+        self._entries = [entry for entry in self._entries if entry[0] >= cutoff]
+
+    async def lookup(
+        self, text: str, scope: Optional[bytes] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[List[float]]]:
+        """Find the cached value most similar to text.
+
+        Args:
+            text: Prompt text.
+            scope: Only entries added with the same scope can match.
+
+        Returns:
+            Tuple of (cached value or None, normalized embedding of text).
+            The embedding is None if it could not be computed; pass it back
+            to ``add`` to store the eventual response without re-embedding.
+        """
+        try:
+            vector = _normalize(await self._embed(text))
+        except Exception:
+            # Embedding failures only disable the cache, never the LLM call
+            return None, None
+
+        self._prune()
+
+        try:
+            # The thread scans a snapshot, so concurrent add() calls stay safe
+            best_value = await asyncio.to_thread(
+                self._best_match, vector, scope, list(self._entries)
+            )
+        except Exception:
+            # A broken scan is a miss, like an embedding failure
+            return None, vector
+        return best_value, vector
+
+    def _best_match(
+        self,
+        vector: List[float],
+        scope: Optional[bytes],
+        entries: List[Tuple[float, List[float], Optional[bytes], Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Return the value of the most similar in-scope entry above the threshold."""
+        best_value = None
+        best_score = self.threshold
+        for _, cached_vector, entry_scope, value in entries:
+            # Vectors from another embedding model can't be compared
+            if entry_scope != scope or len(cached_vector) != len(vector):
+                continue
+            score = math.sumprod(vector, cached_vector)
+            if score >= best_score:
+                best_value, best_score = value, score
+        return best_value
+
+    def add(
+        self,
+        vector: List[float],
+        value: Dict[str, Any],
+        scope: Optional[bytes] = None,
+    ) -> None:
+        """Store a value under a normalized embedding returned by ``lookup``.
+
+        Args:
+            vector: Normalized embedding.
+            value: Value to cache.
+            scope: Scope the lookup was made with.
+        """
+        self._entries.append((time.monotonic(), vector, scope, value))
+        if len(self._entries) > self.max_entries:
+            del self._entries[0]
@@ -0,0 +1,15 @@
+"""Small string helpers shared by console and config output."""
+
+
+def preview(text: str, limit: int) -> str:
+    """Truncate text for one-line display.
+
+    Args:
+        text: Text to shorten.
+        limit: Maximum number of characters kept from text.
+
+    Returns:
+        text unchanged if it fits, otherwise its first limit characters
+        followed by "...".
+    """
+    return text if len(text) <= limit else text[:limit] + "..."
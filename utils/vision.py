@@ -0,0 +1,178 @@
+"""Screenshot downscaling and de-duplication before vision LLM calls."""
+
+import asyncio
+import base64
+import hashlib
+import io
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, List, Optional, Sequence
+
+from llama_index.core.base.llms.types import (
+    ChatMessage,
+    ChatResponse,
+    ChatResponseAsyncGen,
+    ChatResponseGen,
+    ImageBlock,
+    TextBlock,
+)
+from llama_index.core.llms import LLM
+from PIL import Image
+from pydantic import PrivateAttr
+
+from .buffer_pool import BufferPool
+from .llm_wrapper import LLMWrapper
+
+SCREEN_UNCHANGED = "<screen unchanged>"
+
+
+class ScreenshotPreprocessor:
+    """Downscale and JPEG-encode screenshots, dropping repeated frames.
+
+    Encoded frames are cached by content hash, so a screenshot that shows
+    up again (in chat history or on an idle screen) is encoded only once.
+    Within a single request, repeats of an already-sent frame are replaced
+    by a short text marker instead of being uploaded again.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 768,
+        quality: int = 75,
+        cache_size: int = 32,
+        buffer_pool: Optional[BufferPool] = None,
+    ):
+        """Initialize screenshot preprocessor.
+
+        Args:
+            max_size: Maximum length of the longer image side in pixels.
+            quality: JPEG quality (1-95).
+            cache_size: Number of encoded frames to keep.
+            buffer_pool: Pool of JPEG encode buffers. If None, a small private
+                pool is created.
+        """
+        self.max_size = max_size
+        self.quality = quality
+        self.cache_size = cache_size
+        self.buffer_pool = buffer_pool or BufferPool(4)
+        self._encoded: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._lock = Lock()
+
+    def _encode(self, source: io.BytesIO) -> bytes:
+        """Downscale and JPEG-encode an image.
+
+        Args:
+            source: Buffer holding the original image (PNG, JPEG, ...).
+
+        Returns:
+            Base64-encoded JPEG bytes.
+        """
+        source.seek(0)
+        with Image.open(source) as img:
+            frame = img.convert("RGB")
+        frame.thumbnail((self.max_size, self.max_size))
+
+        with self.buffer_pool.buffer() as buf:
+            frame.save(buf, "JPEG", quality=self.quality, optimize=True)
+            # Pooled buffers are not truncated; only the bytes just written count
+            with buf.getbuffer() as view:
+                return base64.b64encode(view[:buf.tell()])
+
+    def _get_encoded(self, digest: bytes, source: io.BytesIO) -> bytes:
+        """Return the encoded frame for digest, encoding it on a cache miss."""
+        with self._lock:
+            encoded = self._encoded.get(digest)
+            if encoded is not None:
+                self._encoded.move_to_end(digest)
+                return encoded
+
+        encoded = self._encode(source)
+
+        with self._lock:
+            self._encoded[digest] = encoded
+            if len(self._encoded) > self.cache_size:
+                self._encoded.popitem(last=False)
+        return encoded
+
+    def process(self, messages: Sequence[ChatMessage]) -> List[ChatMessage]:
+        """Rewrite the image blocks of a chat request.
+
+        Args:
+            messages: Chat messages as produced by the agent.
+
+        Returns:
+            New message list; messages without images are passed through.
+        """
+        seen = set()
+        processed = []
+
+        for message in messages:
+            if not any(isinstance(block, ImageBlock) for block in message.blocks):
+                processed.append(message)
+                continue
+
+            blocks = []
+            for block in message.blocks:
+                # Remote URLs are left for the provider to fetch
+                if not isinstance(block, ImageBlock) or (
+                    block.image is None and block.path is None
+                ):
+                    blocks.append(block)
+                    continue
+
+                # Hash through a view of the decoded buffer instead of copying it
+                source = block.resolve_image()
+                with source.getbuffer() as view:
+                    digest = hashlib.blake2b(view, digest_size=16).digest()
+
+                if digest in seen:
+                    blocks.append(TextBlock(text=SCREEN_UNCHANGED))
+                    continue
+                seen.add(digest)
+
+                blocks.append(ImageBlock(
+                    image=self._get_encoded(digest, source),
+                    image_mimetype="image/jpeg",
+                    detail=block.detail,
+                ))
+
+            processed.append(message.model_copy(update={"blocks": blocks}))
+
+        return processed
+
+
+class VisionLLM(LLMWrapper):
+    """Run chat messages through a ScreenshotPreprocessor before sending."""
+
+    _preprocessor: ScreenshotPreprocessor = PrivateAttr()
+
+    def __init__(self, inner: LLM, preprocessor: ScreenshotPreprocessor, **kwargs: Any):
+        """Initialize vision LLM.
+
+        Args:
+            inner: LLM to send preprocessed messages to.
+            preprocessor: Screenshot preprocessor (may be shared between LLMs).
+        """
+        super().__init__(inner, **kwargs)
+        self._preprocessor = preprocessor
+
+    def chat(self, messages: Sequence[ChatMessage], **kwargs: Any) -> ChatResponse:
+        return self._inner.chat(self._preprocessor.process(messages), **kwargs)
+
+    def stream_chat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponseGen:
+        return self._inner.stream_chat(self._preprocessor.process(messages), **kwargs)
+
+    async def achat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        # Image decoding/encoding is CPU work, keep it off the event loop
+        messages = await asyncio.to_thread(self._preprocessor.process, messages)
+        return await self._inner.achat(messages, **kwargs)
+
+    async def astream_chat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponseAsyncGen:
+        messages = await asyncio.to_thread(self._preprocessor.process, messages)
+        return await self._inner.astream_chat(messages, **kwargs)